@@ -0,0 +1,38 @@
+"""
+Django test settings for todoproject project.
+
+Extends the default settings with overrides that keep the test suite fast.
+Run the tests with:
+
+    python manage.py test --settings=todoproject.settings_test --parallel=auto
+
+The test classes share no state, so they can be split across worker
+processes; each worker gets its own clone of the test database.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+
+# Database
+# Keep the test database in memory to avoid disk I/O. TEST["NAME"] is left
+# unset so parallel workers get their own auto-named clones. Migrations are
+# skipped and the tables are created straight from the current models.
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "TEST": {
+            "MIGRATE": False,
+        },
+    }
+}
+
+
+# Password hashing
+# A fast, insecure hasher keeps user creation cheap in tests.
+# https://docs.djangoproject.com/en/5.2/topics/testing/overview/#password-hashing
+
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]
@@ -0,0 +1,29 @@
+from django.core.checks import Error
+from django.urls import NoReverseMatch, reverse
+
+# URL names and the paths they are expected to resolve to
+EXPECTED_URLS = [
+    ("todo_list", (), "/"),
+    ("todo_create", (), "/create/"),
+    ("todo_update", (1,), "/update/1/"),
+    ("todo_delete", (1,), "/delete/1/"),
+    ("todo_toggle", (1,), "/toggle/1/"),
+]
+
+
+def check_url_paths(app_configs, **kwargs):
+    """Check that each named TODO URL resolves to its expected path"""
+    errors = []
+    for name, args, expected in EXPECTED_URLS:
+        try:
+            path = reverse(name, args=args)
+        except NoReverseMatch:
+            path = None
+        if path != expected:
+            errors.append(
+                Error(
+                    f"URL '{name}' resolves to {path!r}, expected {expected!r}.",
+                    id="todos.E001",
+                )
+            )
+    return errors
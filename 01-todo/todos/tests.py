@@ -1,17 +1,37 @@
-from django.test import TestCase
+from django.core import checks
+from django.http import Http404
+from django.test import RequestFactory, SimpleTestCase, TestCase
 from django.urls import reverse
 from django.utils import timezone
-from datetime import timedelta
+from datetime import datetime, timedelta
+from itertools import count
+from unittest import mock
 from .models import Todo
+from .views import TodoDeleteView
 
 # Create your tests here.
 
+# Static URLs are resolved once at import instead of in every test
+TODO_LIST_URL = reverse('todo_list')
+TODO_CREATE_URL = reverse('todo_create')
+
+# Fixed, whole-second reference time so datetime round-trips stay exact
+FIXED_NOW = timezone.make_aware(datetime(2025, 1, 1))
+
+
+def make_todos(n, **kwargs):
+    """Create TODOs titled "TODO 1" to "TODO n" in a single query"""
+    return Todo.objects.bulk_create([
+        Todo(title=f"TODO {i}", **kwargs) for i in range(1, n + 1)
+    ])
+
+
 class TodoModelTest(TestCase):
     """Test cases for the Todo model"""
 
     def test_create_todo_with_all_fields(self):
         """Test creating a TODO with all fields"""
-        due_date = timezone.now() + timedelta(days=1)
+        due_date = FIXED_NOW + timedelta(days=1)
         todo = Todo.objects.create(
             title="Test TODO",
             description="Test description",
@@ -43,14 +63,19 @@ class TodoModelTest(TestCase):
 
     def test_todo_ordering(self):
         """Test that TODOs are ordered by newest first"""
-        todo1 = Todo.objects.create(title="First")
-        todo2 = Todo.objects.create(title="Second")
-        todo3 = Todo.objects.create(title="Third")
-
-        todos = Todo.objects.all()
-        self.assertEqual(todos[0], todo3)  # Newest first
-        self.assertEqual(todos[1], todo2)
-        self.assertEqual(todos[2], todo1)
+        # bulk_create stamps every row in one go, so hand out strictly
+        # increasing timestamps to keep created_at distinct
+        start = timezone.now()
+        ticks = (start + timedelta(seconds=i) for i in count())
+        with mock.patch('django.utils.timezone.now', side_effect=ticks):
+            todo1, todo2, todo3 = Todo.objects.bulk_create([
+                Todo(title="First"),
+                Todo(title="Second"),
+                Todo(title="Third"),
+            ])
+
+        todos = list(Todo.objects.all())
+        self.assertEqual(todos, [todo3, todo2, todo1])  # Newest first
 
     def test_todo_timestamps(self):
         """Test that created_at and updated_at are set"""
@@ -64,27 +89,29 @@ class TodoListViewTest(TestCase):
 
     def test_list_view_with_no_todos(self):
         """Test list view when no TODOs exist"""
-        response = self.client.get(reverse('todo_list'))
+        response = self.client.get(TODO_LIST_URL)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "No TODOs yet")
-        self.assertEqual(len(response.context['todos']), 0)
+        self.assertFalse(response.context['todos'].exists())
 
     def test_list_view_with_todos(self):
         """Test list view displays all TODOs"""
-        todo1 = Todo.objects.create(title="TODO 1")
-        todo2 = Todo.objects.create(title="TODO 2")
+        make_todos(2)
 
-        response = self.client.get(reverse('todo_list'))
+        with self.assertNumQueries(1):
+            response = self.client.get(TODO_LIST_URL)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "TODO 1")
-        self.assertContains(response, "TODO 2")
-        self.assertEqual(len(response.context['todos']), 2)
+        titles = [todo.title for todo in response.context['todos']]
+        self.assertIn("TODO 1", titles)
+        self.assertIn("TODO 2", titles)
+        self.assertEqual(response.context['todos'].count(), 2)
 
     def test_list_view_shows_resolved_status(self):
         """Test that resolved TODOs are displayed differently"""
         todo = Todo.objects.create(title="Resolved TODO", resolved=True)
 
-        response = self.client.get(reverse('todo_list'))
+        response = self.client.get(TODO_LIST_URL)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Resolved TODO")
 
@@ -94,7 +121,7 @@ class TodoCreateViewTest(TestCase):
 
     def test_create_view_get(self):
         """Test GET request shows the create form"""
-        response = self.client.get(reverse('todo_create'))
+        response = self.client.get(TODO_CREATE_URL)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Create New TODO")
 
@@ -104,21 +131,19 @@ class TodoCreateViewTest(TestCase):
             'title': 'New TODO',
             'description': 'New description',
         }
-        response = self.client.post(reverse('todo_create'), data)
+        response = self.client.post(TODO_CREATE_URL, data)
 
-        self.assertEqual(Todo.objects.count(), 1)
-        todo = Todo.objects.first()
+        todo = Todo.objects.get()  # Exactly one TODO was created
         self.assertEqual(todo.title, 'New TODO')
         self.assertEqual(todo.description, 'New description')
-        self.assertRedirects(response, reverse('todo_list'))
+        self.assertRedirects(response, TODO_LIST_URL)
 
     def test_create_todo_without_optional_fields(self):
         """Test creating a TODO without description and due_date"""
         data = {'title': 'Just a title'}
-        response = self.client.post(reverse('todo_create'), data)
+        response = self.client.post(TODO_CREATE_URL, data)
 
-        self.assertEqual(Todo.objects.count(), 1)
-        todo = Todo.objects.first()
+        todo = Todo.objects.get()  # Exactly one TODO was created
         self.assertEqual(todo.title, 'Just a title')
         self.assertEqual(todo.description, '')
         self.assertIsNone(todo.due_date)
@@ -127,16 +152,18 @@ class TodoCreateViewTest(TestCase):
 class TodoUpdateViewTest(TestCase):
     """Test cases for updating TODOs"""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Create a TODO for testing updates"""
-        self.todo = Todo.objects.create(
+        cls.todo = Todo.objects.create(
             title="Original Title",
             description="Original description"
         )
 
     def test_update_view_get(self):
         """Test GET request shows update form with existing data"""
-        response = self.client.get(reverse('todo_update', args=[self.todo.pk]))
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('todo_update', args=[self.todo.pk]))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Original Title")
 
@@ -154,7 +181,7 @@ class TodoUpdateViewTest(TestCase):
 
         self.todo.refresh_from_db()
         self.assertEqual(self.todo.title, 'Updated Title')
-        self.assertRedirects(response, reverse('todo_list'))
+        self.assertRedirects(response, TODO_LIST_URL)
 
     def test_update_resolved_status(self):
         """Test updating resolved status"""
@@ -175,28 +202,32 @@ class TodoUpdateViewTest(TestCase):
 class TodoDeleteViewTest(TestCase):
     """Test cases for deleting TODOs"""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Create a TODO for testing deletion"""
-        self.todo = Todo.objects.create(title="TODO to delete")
+        cls.todo = Todo.objects.create(title="TODO to delete")
 
     def test_delete_view_get(self):
         """Test GET request shows confirmation page"""
-        response = self.client.get(reverse('todo_delete', args=[self.todo.pk]))
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('todo_delete', args=[self.todo.pk]))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Are you sure you want to delete")
-        self.assertContains(response, "TODO to delete")
+        self.assertEqual(response.context['todo'].title, "TODO to delete")
 
     def test_delete_todo(self):
         """Test POST request deletes the TODO"""
         response = self.client.post(reverse('todo_delete', args=[self.todo.pk]))
 
         self.assertEqual(Todo.objects.count(), 0)
-        self.assertRedirects(response, reverse('todo_list'))
+        self.assertRedirects(response, TODO_LIST_URL)
 
     def test_delete_nonexistent_todo(self):
         """Test deleting a non-existent TODO returns 404"""
-        response = self.client.get(reverse('todo_delete', args=[9999]))
-        self.assertEqual(response.status_code, 404)
+        # Call the view directly; a 404 needs no middleware
+        request = RequestFactory().get(reverse('todo_delete', args=[9999]))
+        with self.assertRaises(Http404):
+            TodoDeleteView.as_view()(request, pk=9999)
 
 
 class TodoToggleResolvedTest(TestCase):
@@ -210,7 +241,7 @@ class TodoToggleResolvedTest(TestCase):
 
         todo.refresh_from_db()
         self.assertTrue(todo.resolved)
-        self.assertRedirects(response, reverse('todo_list'))
+        self.assertRedirects(response, TODO_LIST_URL)
 
     def test_toggle_resolved_to_unresolved(self):
         """Test toggling a TODO from resolved back to unresolved"""
@@ -220,33 +251,12 @@ class TodoToggleResolvedTest(TestCase):
 
         todo.refresh_from_db()
         self.assertFalse(todo.resolved)
-        self.assertRedirects(response, reverse('todo_list'))
+        self.assertRedirects(response, TODO_LIST_URL)
 
 
-class TodoURLTest(TestCase):
+class TodoURLTest(SimpleTestCase):
     """Test cases for URL routing"""
 
-    def test_list_url_resolves(self):
-        """Test that list URL resolves correctly"""
-        url = reverse('todo_list')
-        self.assertEqual(url, '/')
-
-    def test_create_url_resolves(self):
-        """Test that create URL resolves correctly"""
-        url = reverse('todo_create')
-        self.assertEqual(url, '/create/')
-
-    def test_update_url_resolves(self):
-        """Test that update URL resolves correctly"""
-        url = reverse('todo_update', args=[1])
-        self.assertEqual(url, '/update/1/')
-
-    def test_delete_url_resolves(self):
-        """Test that delete URL resolves correctly"""
-        url = reverse('todo_delete', args=[1])
-        self.assertEqual(url, '/delete/1/')
-
-    def test_toggle_url_resolves(self):
-        """Test that toggle URL resolves correctly"""
-        url = reverse('todo_toggle', args=[1])
-        self.assertEqual(url, '/toggle/1/')
+    def test_urls_check(self):
+        """Test that the URL system check reports no errors"""
+        self.assertEqual(checks.run_checks(tags=[checks.Tags.urls]), [])